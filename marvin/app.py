@@ -23,7 +23,7 @@ description = f"""
 
 
 @asynccontextmanager
-async def lifespan_fn(_: FastAPI) -> AsyncGenerator[None, None]:
+async def lifespan_fn(fastapi_app: FastAPI) -> AsyncGenerator[None, None]:
     """
     lifespan_fn controls the startup and shutdown of the FastAPI Application
     This function is called when the FastAPI application starts and stops
@@ -38,6 +38,10 @@ async def lifespan_fn(_: FastAPI) -> AsyncGenerator[None, None]:
     init_db.main()
     logger.info("end: database initialization")
 
+    if fastapi_app.openapi_url:
+        # build the OpenAPI schema up front so the first /openapi.json request doesn't pay for it
+        fastapi_app.openapi()
+
     logger.info("------APP SETTINGS------")
     logger.info(
         settings.model_dump_json(
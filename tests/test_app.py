@@ -0,0 +1,19 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from marvin.app import lifespan_fn
+
+
+def test_openapi_schema_built_on_startup():
+    app = FastAPI(lifespan=lifespan_fn)
+    assert app.openapi_schema is None
+
+    with TestClient(app):
+        assert app.openapi_schema is not None
+
+
+def test_openapi_schema_skipped_without_openapi_url():
+    app = FastAPI(lifespan=lifespan_fn, openapi_url=None)
+
+    with TestClient(app):
+        assert app.openapi_schema is None